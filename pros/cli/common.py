@@ -174,11 +174,13 @@ def project_option(arg_name='project', required: bool = True, default: str = '.'
 def shadow_command(command: click.Command):
     def wrapper(f: Union[click.Command, Callable]):
         if isinstance(f, click.Command):
-            f.params.extend(p for p in command.params if p.name not in [p.name for p in command.params])
+            params = f.params
         else:
             if not hasattr(f, '__click_params__'):
                 f.__click_params__ = []
-            f.__click_params__.extend(p for p in command.params if p.name not in [p.name for p in f.__click_params__])
+            params = f.__click_params__
+        existing_names = {p.name for p in params}
+        params.extend(p for p in command.params if p.name not in existing_names)
         return f
 
     return wrapper
@@ -206,10 +208,11 @@ def resolve_v5_port(port: Optional[str], type: str, quiet: bool = False) -> Opti
             return None
         if len(ports) > 1:
             if not quiet:
+                devices = [p.device for p in ports]
                 port = click.prompt('Multiple {} ports were found. Please choose one: '.format('v5'),
-                                    default=ports[0].device,
-                                    type=click.Choice([p.device for p in ports]))
-                assert port in [p.device for p in ports]
+                                    default=devices[0],
+                                    type=click.Choice(devices))
+                assert port in devices
             else:
                 return None
         else:
@@ -230,10 +233,11 @@ def resolve_cortex_port(port: Optional[str], quiet: bool = False) -> Optional[st
             return None
         if len(ports) > 1:
             if not quiet:
+                devices = [p.device for p in ports]
                 port = click.prompt('Multiple {} ports were found. Please choose one: '.format('cortex'),
-                                    default=ports[0].device,
-                                    type=click.Choice([p.device for p in ports]))
-                assert port in [p.device for p in ports]
+                                    default=devices[0],
+                                    type=click.Choice(devices))
+                assert port in devices
             else:
                 return None
         else:
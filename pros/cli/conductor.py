@@ -41,6 +41,7 @@ def fetch(query: c.BaseTemplate):
     Visit https://pros.cs.purdue.edu/v5/cli/conductor.html to learn more
     """
 
+    _conductor = c.Conductor()
     template_file = None
     if os.path.exists(query.identifier):
         template_file = query.identifier
@@ -62,17 +63,17 @@ def fetch(query: c.BaseTemplate):
     else:
         if template_file:
             logger(__name__).debug(f'Template file exists but is not a valid template: {template_file}')
-        template = c.Conductor().resolve_template(query, allow_offline=False)
+        template = _conductor.resolve_template(query, allow_offline=False)
         logger(__name__).debug(f'Template from resolved query: {template}')
         if template is None:
             logger(__name__).error(f'There are no templates matching {query}!')
             return -1
-        depot = c.Conductor().get_depot(template.metadata['origin'])
+        depot = _conductor.get_depot(template.metadata['origin'])
         logger(__name__).debug(f'Found depot: {depot}')
     # query.metadata contain all of the extra args that also go to the depot. There's no way for us to determine
     # whether the arguments are for the template or for the depot, so they share them
     logger(__name__).debug(f'Additional depot and template args: {query.metadata}')
-    c.Conductor().fetch_template(depot, template, **query.metadata)
+    _conductor.fetch_template(depot, template, **query.metadata)
 
 
 @conductor.command(context_settings={'ignore_unknown_options': True})
@@ -175,7 +176,7 @@ def uninstall_template(project: c.Project, query: c.BaseTemplate, remove_user: b
 
 @conductor.command('new-project', aliases=['new', 'create-project'])
 @click.argument('path', type=click.Path())
-@click.argument('target', default=c.Conductor().default_target, type=click.Choice(['v5', 'cortex']))
+@click.argument('target', default=None, required=False, type=click.Choice(['v5', 'cortex']))
 @click.argument('version', default='latest')
 @click.option('--force-user', 'force_user', default=False, is_flag=True,
               help='Replace all user files in a template')
@@ -199,8 +200,6 @@ def new_project(ctx: click.Context, path: str, target: str, version: str,
 
     Visit https://pros.cs.purdue.edu/v5/cli/conductor.html to learn more
     """
-    if version.lower() == 'latest' or not version:
-        version = '>0'
     if not force_system and c.Project.find_project(path) is not None:
         logger(__name__).error('A project already exists in this location! Delete it first', extra={'sentry': False})
         ctx.exit(-1)
@@ -264,9 +263,9 @@ def query_templates(ctx, query: c.BaseTemplate, allow_offline: bool, allow_onlin
                 'local': isinstance(template, c.LocalTemplate)
             }
     import semantic_version as semver
-    render_templates = sorted(render_templates.values(), key=lambda k: k['local'])  # tertiary key
-    render_templates = sorted(render_templates, key=lambda k: semver.Version(k['version']),
-                              reverse=True)  # secondary key
+    # secondary (newest version first) and tertiary (local last) keys in one pass
+    render_templates = sorted(render_templates.values(), key=lambda k: (semver.Version(k['version']), not k['local']),
+                              reverse=True)
     render_templates = sorted(render_templates, key=lambda k: k['name'])  # primary key
     ui.finalize('template-query', render_templates)
 
@@ -286,11 +285,13 @@ def info_project(project: c.Project, ls_upgrades):
     report = ProjectReport(project)
     _conductor = c.Conductor()
     if ls_upgrades:
+        import semantic_version as semver
+        # query the depots once for the project's target, then narrow the listing per installed template
+        candidates = _conductor.resolve_templates(c.BaseTemplate.create_query(target=project.target))
         for template in report.project['templates']:
-            import semantic_version as semver
-            templates = _conductor.resolve_templates(c.BaseTemplate.create_query(name=template["name"],
-                                                                                 version=f'>{template["version"]}',
-                                                                                 target=project.target))
+            query = c.BaseTemplate.create_query(name=template["name"], version=f'>{template["version"]}',
+                                                target=project.target)
+            templates = [t for t in candidates if t.satisfies(query)]
             template["upgrades"] = sorted({t.version for t in templates}, key=lambda v: semver.Version(v), reverse=True)
 
     ui.finalize('project-report', report)
@@ -72,13 +72,12 @@ def create_template(ctx, path: str, destination: str, do_zip: bool, **kwargs):
     kwargs['metadata'] = {ctx.args[i][2:]: ctx.args[i + 1] for i in range(0, int(len(ctx.args) / 2) * 2, 2)}
 
     def get_matching_files(globs: List[str]) -> Set[str]:
-        matching_files: List[str] = []
+        matching_files: Set[str] = set()
         _path = os.path.normpath(path) + os.path.sep
         for g in [g for g in globs if glob.has_magic(g)]:
             files = glob.glob(f'{path}/{g}', recursive=True)
             files = filter(lambda f: os.path.isfile(f), files)
-            files = [os.path.normpath(os.path.normpath(f).split(_path)[-1]) for f in files]
-            matching_files.extend(files)
+            matching_files.update(os.path.normpath(os.path.normpath(f).split(_path)[-1]) for f in files)
 
         # matches things like src/opcontrol.{c,cpp} so that we can expand to src/opcontrol.c and src/opcontrol.cpp
         pattern = re.compile(r'^([\w{}]+.){{((?:\w+,)*\w+)}}$'.format(os.path.sep.replace('\\', '\\\\')))
@@ -86,11 +85,10 @@ def create_template(ctx, path: str, destination: str, do_zip: bool, **kwargs):
             if re.match(pattern, f):
                 matches = re.split(pattern, f)
                 logger(__name__).debug(f'Matches on {f}: {matches}')
-                matching_files.extend([f'{matches[1]}{ext}' for ext in matches[2].split(',')])
+                matching_files.update(f'{matches[1]}{ext}' for ext in matches[2].split(','))
             else:
-                matching_files.append(f)
+                matching_files.add(f)
 
-        matching_files: Set[str] = set(matching_files)
         return matching_files
 
     matching_system_files: Set[str] = get_matching_files(kwargs['system_files'])
@@ -142,7 +142,8 @@ class Conductor(Config):
         v.build = v.build if len(v.build) else ('',)
         query.version = f'=={v}'
         logger(__name__).info(f'Resolved to {query.identifier}')
-        templates = self.resolve_templates(query, **kwargs)
+        # narrow the candidates we already have instead of querying every depot (and saving) a second time
+        templates = [t for t in templates if t.satisfies(query, kernel_version=kwargs.get('kernel_version', None))]
         if not any(templates):
             return None
         # prefer local templates first
@@ -152,12 +153,12 @@ class Conductor(Config):
             if len(local_templates) > 1:
                 # This should never happen! Conductor state must be invalid
                 raise Exception(f'Multiple local templates satisfy {query.identifier}!')
-            return [t for t in templates if isinstance(t, LocalTemplate)][0]
+            return local_templates[0]
 
         # prefer pros-mainline template second
-        mainline_templates = [t for t in templates if t.metadata['origin'] == 'pros-mainline']
-        if any(mainline_templates):
-            return mainline_templates[0]
+        mainline_template = next((t for t in templates if t.metadata['origin'] == MAINLINE_NAME), None)
+        if mainline_template is not None:
+            return mainline_template
 
         # No preference, just FCFS
         return templates[0]
@@ -223,7 +224,7 @@ class Conductor(Config):
         else:
             proj.project_name = os.path.basename(os.path.normpath(os.path.abspath(path)))
         if 'version' in kwargs:
-            if kwargs['version'] == 'latest':
+            if not kwargs['version'] or kwargs['version'].lower() == 'latest':
                 kwargs['version'] = '>=0'
             self.apply_template(proj, identifier='kernel', **kwargs)
         proj.save()
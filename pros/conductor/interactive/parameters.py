@@ -79,10 +79,12 @@ class TemplateParameter(p.ValidatableParameter[BaseTemplate]):
         if not template and len(options) == 0:
             raise ValueError('At least template or versions must be defined for a TemplateParameter')
 
-        self.options = {t.name: {_t.version: _t for _t in options if t.name == _t.name} for t in options}
+        self.options: Dict[str, Dict[str, BaseTemplate]] = {}
+        for t in options:
+            self.options.setdefault(t.name, {})[t.version] = t
 
         if not template:
-            first_template = list(self.options.values())[0]
+            first_template = next(iter(self.options.values()))
             template = first_template[str(Spec('>0').select([Version(v) for v in first_template.keys()]))]
 
         super().__init__(template, allow_invalid_input)
@@ -81,10 +81,8 @@ class Project(Config):
             if current > template:
                 return TemplateAction.Downgradable
 
-        if any([template > current for current in self.templates.values()]):
-            return TemplateAction.Upgradable
-        else:
-            return TemplateAction.Installable
+        # BaseTemplate comparisons only hold between templates of the same name, which were all handled above
+        return TemplateAction.Installable
 
     def template_is_installed(self, query: BaseTemplate) -> bool:
         return self.get_template_actions(query) == TemplateAction.AlreadyInstalled
@@ -64,6 +64,6 @@ def cli_config() -> CliConfig:
         return CliConfig()
     ctx.ensure_object(dict)
     assert isinstance(ctx.obj, dict)
-    if not hasattr(ctx.obj, 'cli_config') or not isinstance(ctx.obj['cli_config'], CliConfig):
+    if not isinstance(ctx.obj.get('cli_config'), CliConfig):
         ctx.obj['cli_config'] = CliConfig()
     return ctx.obj['cli_config']